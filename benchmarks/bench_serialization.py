@@ -0,0 +1,96 @@
+"""
+Benchmark the call persistence and GET /calls serialization paths
+
+Compares the previous stdlib path (indented json.dump, per-file json.load,
+stdlib response encoding) with functions.serializer (orjson when installed,
+compact files, bytes-based decoding).
+
+Usage:
+    python benchmarks/bench_serialization.py [num_calls] [repeat]
+"""
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import serializer
+
+
+def make_call(i: int) -> dict:
+    record = {
+        "mc_number": str(100000 + i),
+        "company_name": f"Transportes Ejemplo {i} S.L.",
+        "load_id": f"L{1000 + i % 20}",
+        "transcript": "Agente: Buenos días, ¿en qué puedo ayudarle? " * 20,
+    }
+    if i % 3:
+        record.update({"initial_offer": "2500", "final_price": "2700", "negotiation_rounds": "2"})
+    else:
+        record["reason"] = "no_acuerdo_precio"
+    return record
+
+
+def stdlib_response(content) -> bytes:
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def old_write(directory, records):
+    for i, data in enumerate(records):
+        with open(os.path.join(directory, f"call_{i}.json"), "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def new_write(directory, records):
+    for i, data in enumerate(records):
+        with open(os.path.join(directory, f"call_{i}.json"), "wb") as f:
+            f.write(serializer.dumps(data))
+
+
+def old_read(directory):
+    calls = []
+    for filename in os.listdir(directory):
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            calls.append(json.load(f))
+    return stdlib_response({"calls": calls})
+
+
+def new_read(directory):
+    calls = []
+    for filename in os.listdir(directory):
+        with open(os.path.join(directory, filename), "rb") as f:
+            calls.append(serializer.loads(f.read()))
+    return serializer.dumps({"calls": calls})
+
+
+def best_of(fn, repeat, *args):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    num_calls = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    records = [make_call(i) for i in range(num_calls)]
+
+    print(f"serializer backend: {serializer.BACKEND}, calls: {num_calls}, best of {repeat}")
+    with tempfile.TemporaryDirectory() as old_dir, tempfile.TemporaryDirectory() as new_dir:
+        results = [
+            ("write", best_of(old_write, repeat, old_dir, records), best_of(new_write, repeat, new_dir, records)),
+            ("read + encode", best_of(old_read, repeat, old_dir), best_of(new_read, repeat, new_dir)),
+        ]
+        # New code must read files written by the old code
+        assert json.loads(new_read(old_dir)) == json.loads(old_read(old_dir))
+
+    for name, old, new in results:
+        print(f"{name:>14}: stdlib {old * 1000:8.2f} ms | serializer {new * 1000:8.2f} ms | {old / new:5.2f}x")
+
+
+if __name__ == "__main__":
+    main()
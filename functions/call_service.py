@@ -1,9 +1,13 @@
 import asyncio
 import random
-from typing import Dict, Any
+from typing import Dict, Any, List
 from datetime import datetime
 import os
-import json
+from functions import serializer
+from functions.response_cache import response_cache
+
+# Monotonic version of the call store, bumped on every successful write
+_store_version = 0
 
 class CallService:
     """Service for handling call finalization and analysis"""
@@ -11,6 +15,11 @@ class CallService:
     def __init__(self):
         self.temp_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "temp")
         os.makedirs(self.temp_dir, exist_ok=True)
+
+    @property
+    def store_version(self) -> int:
+        """Current version of the call store, used to build ETags for GET /calls"""
+        return _store_version
     
     async def process_call_finalization(self, call_data) -> Dict[str, Any]:
         """
@@ -81,6 +90,87 @@ class CallService:
                 }
             }
 
+    def get_calls_with_stats(self) -> Dict[str, Any]:
+        """
+        Read every stored call record and compute aggregate statistics
+        
+        Returns:
+            Dict[str, Any]: {"calls": [...], "stats": {...}}
+        """
+        calls = []
+        stats = {
+            "total_calls": 0,
+            "total_deals": 0,
+            "total_no_deals": 0,
+            "reasons": {},
+            "avg_final_price": None,
+            "avg_negotiation_rounds": None
+        }
+        final_prices = []
+        negotiation_rounds = []
+    
+        for data in self._read_call_records(self.temp_dir):
+            calls.append(data)
+
+            # Check if this is a deal (has final_price) or no-deal (has reason)
+            if "reason" in data:
+                # This is a no-deal call
+                stats["total_no_deals"] += 1
+                reason = data.get("reason")
+                if reason:
+                    stats["reasons"].setdefault(reason, 0)
+                    stats["reasons"][reason] += 1
+            elif "final_price" in data:
+                # This is a successful deal
+                stats["total_deals"] += 1
+                price = data.get("final_price")
+                rounds = data.get("negotiation_rounds")
+                try:
+                    if price is not None:
+                        final_prices.append(float(price))
+                except Exception:
+                    pass
+                try:
+                    if rounds is not None:
+                        negotiation_rounds.append(int(rounds))
+                except Exception:
+                    pass
+    
+        stats["total_calls"] = stats["total_deals"] + stats["total_no_deals"]
+        if final_prices:
+            stats["avg_final_price"] = round(sum(final_prices) / len(final_prices), 2)
+        if negotiation_rounds:
+            stats["avg_negotiation_rounds"] = round(sum(negotiation_rounds) / len(negotiation_rounds), 2)
+    
+        return {"calls": calls, "stats": stats}
+
+    def _read_call_records(self, temp_dir: str) -> List[Dict[str, Any]]:
+        """
+        Read and decode every call JSON file in temp_dir
+        
+        Files that cannot be read or do not hold a JSON object are skipped
+        with a warning. Files written with the old indented format decode the
+        same way.
+        """
+        records = []
+        try:
+            filenames = os.listdir(temp_dir)
+        except FileNotFoundError:
+            print(f"[WARN] Temp directory not found: {temp_dir}")
+            return records
+
+        for filename in filenames:
+            if filename.endswith(".json"):
+                try:
+                    with open(os.path.join(temp_dir, filename), "rb") as f:
+                        data = serializer.loads(f.read())
+                    if not isinstance(data, dict):
+                        raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+                    records.append(data)
+                except Exception as e:
+                    print(f"[WARN] Could not read {filename}: {e}")
+        return records
+
     async def _save_json_to_file(self, call_data, no_deal: bool = False):
         """
         Save the call finalization JSON to a file in /temp with a unique filename
@@ -94,7 +184,17 @@ class CallService:
             suffix = "no_deal" if no_deal else "deal"
             filename = f"call_{data.get('mc_number', 'unknown')}_{suffix}_{timestamp}.json"
             filepath = os.path.join(self.temp_dir, filename)
-            with open(filepath, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(filepath, "wb") as f:
+                f.write(serializer.dumps(data))
+            self._bump_store_version()
         except Exception as e:
-            print(f"[WARN] Could not save call finalization JSON: {e}") 
\ No newline at end of file
+            print(f"[WARN] Could not save call finalization JSON: {e}")
+
+    @staticmethod
+    def _bump_store_version():
+        """
+        Advance the call store version and drop cached GET /calls responses
+        """
+        global _store_version
+        _store_version += 1
+        response_cache.invalidate("calls")
@@ -3,12 +3,52 @@ import asyncio
 from typing import Dict, Any, Optional
 from datetime import datetime, timedelta
 from num2words import num2words
+from functions.response_cache import response_cache
+
+# Shared load inventory and its monotonic version, bumped whenever it is regenerated
+_inventory = None
+_inventory_version = 0
+_inventory_generated_at = None
+
+# Maximum age of the shared inventory before it is regenerated
+INVENTORY_TTL = timedelta(hours=1)
 
 class LoadService:
     """Service for handling load management and selection"""
     
     def __init__(self):
-        self.mock_loads = self._generate_mock_loads()
+        if self._inventory_is_stale():
+            self.refresh_inventory()
+        self.mock_loads = _inventory
+
+    @staticmethod
+    def _inventory_is_stale() -> bool:
+        """
+        Check whether the shared inventory is missing, older than the TTL or from a previous day
+        """
+        if _inventory is None or _inventory_generated_at is None:
+            return True
+        now = datetime.now()
+        return (
+            now - _inventory_generated_at >= INVENTORY_TTL
+            or now.date() != _inventory_generated_at.date()
+        )
+
+    @property
+    def inventory_version(self) -> int:
+        """Current version of the load inventory, used to build ETags for GET /loads/best"""
+        return _inventory_version
+
+    def refresh_inventory(self):
+        """
+        Regenerate the shared load inventory and drop cached GET /loads/best responses
+        """
+        global _inventory, _inventory_version, _inventory_generated_at
+        _inventory = self._generate_mock_loads()
+        _inventory_generated_at = datetime.now()
+        _inventory_version += 1
+        self.mock_loads = _inventory
+        response_cache.invalidate("loads_best")
 
     def euros_to_text(self, euros: int) -> str:
         texto = num2words(euros, lang='es')
@@ -59,6 +99,26 @@ class LoadService:
         
         return loads
     
+    def find_best_load(self, equipment_type: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the highest-rate load for an equipment type, without any random fallback
+        
+        Args:
+            equipment_type (str): Type of equipment/truck
+            
+        Returns:
+            Optional[Dict[str, Any]]: Best matching load, or None if there is no match
+        """
+        # Filter loads by equipment type
+        filtered_loads = [
+            load for load in self.mock_loads
+            if load["equipment_type"].lower() == equipment_type.lower()
+        ]
+        if not filtered_loads:
+            return None
+        # Return the best load (highest rate) for the equipment type
+        return max(filtered_loads, key=lambda x: x["loadboard_rate"])
+
     async def get_best_available_load(self, equipment_type: Optional[str] = None) -> Dict[str, Any]:
         """
         Get the best available load based on equipment type or random selection
@@ -76,15 +136,8 @@ class LoadService:
             available_loads = self.mock_loads.copy()
             
             if equipment_type:
-                # Filter loads by equipment type
-                filtered_loads = [
-                    load for load in available_loads 
-                    if load["equipment_type"].lower() == equipment_type.lower()
-                ]
-                
-                if filtered_loads:
-                    # Return the best load (highest rate) for the equipment type
-                    best_load = max(filtered_loads, key=lambda x: x["loadboard_rate"])
+                best_load = self.find_best_load(equipment_type)
+                if best_load is not None:
                     return best_load
                 else:
                     # No loads found for specific equipment type, return random load
@@ -0,0 +1,126 @@
+import hashlib
+import uuid
+from typing import Any, Dict, Optional, Tuple
+from fastapi.responses import JSONResponse, Response
+from functions import serializer
+
+# Random per-process token so ETags issued by one worker never validate against
+# another worker (or a restarted process) whose version counters started over.
+_INSTANCE_TOKEN = uuid.uuid4().hex[:8]
+
+
+class CachedResponse:
+    """Serialized response body plus the strong ETag it was issued with"""
+
+    __slots__ = ("version", "etag", "body")
+
+    def __init__(self, version: int, etag: str, body: bytes):
+        self.version = version
+        self.etag = etag
+        self.body = body
+
+
+class ResponseCache:
+    """In-memory cache of serialized GET responses keyed by (namespace, query, version)"""
+
+    def __init__(self):
+        self._entries: Dict[Tuple[str, str], CachedResponse] = {}
+
+    @staticmethod
+    def make_etag(namespace: str, key: str, version: int) -> str:
+        """
+        Build a strong ETag for a namespace/query at a given store version
+
+        Args:
+            namespace (str): Logical resource, e.g. "calls" or "loads_best"
+            key (str): Normalized query the response was built for
+            version (int): Monotonic version of the backing store
+
+        Returns:
+            str: Quoted strong ETag
+        """
+        key_digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+        return f'"{namespace}-{_INSTANCE_TOKEN}-{version}-{key_digest}"'
+
+    def get(self, namespace: str, key: str, version: int) -> Optional[CachedResponse]:
+        """
+        Return the cached response for a query if it was built at the current version
+        """
+        entry = self._entries.get((namespace, key))
+        if entry is None or entry.version != version:
+            return None
+        return entry
+
+    def put(self, namespace: str, key: str, version: int, body: bytes) -> CachedResponse:
+        """
+        Store a serialized response body and return the cache entry with its ETag
+        """
+        entry = CachedResponse(version, self.make_etag(namespace, key, version), body)
+        self._entries[(namespace, key)] = entry
+        return entry
+
+    def invalidate(self, namespace: str) -> None:
+        """
+        Drop every cached response for a namespace
+        """
+        for cache_key in [k for k in self._entries if k[0] == namespace]:
+            del self._entries[cache_key]
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check an If-None-Match header against an ETag (weak comparison, RFC 7232)
+
+    Args:
+        if_none_match (Optional[str]): Raw If-None-Match header value
+        etag (str): Current quoted ETag
+
+    Returns:
+        bool: True if the client already holds this representation
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through the pluggable serializer (orjson when installed)"""
+
+    def render(self, content: Any) -> bytes:
+        return serializer.dumps(content)
+
+
+def encode_json(content: Any) -> bytes:
+    """
+    Serialize a response payload to the bytes FastJSONResponse would send
+    """
+    return serializer.dumps(content)
+
+
+def cached_json_response(entry: CachedResponse, if_none_match: Optional[str] = None) -> Response:
+    """
+    Build the HTTP response for a cache entry, answering 304 if the client's copy is current
+
+    Args:
+        entry (CachedResponse): Cached body and ETag
+        if_none_match (Optional[str]): Raw If-None-Match header value
+
+    Returns:
+        Response: 304 Not Modified or 200 with the pre-encoded JSON body
+    """
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+# Shared cache used by the GET routes
+response_cache = ResponseCache()
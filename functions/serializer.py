@@ -0,0 +1,54 @@
+import json
+from typing import Any
+
+# Use orjson when it is installed, otherwise fall back to the stdlib encoder.
+# Both backends emit compact UTF-8 JSON, so output is readable by either one.
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+
+def dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to compact UTF-8 JSON bytes
+
+    The stdlib fallback uses the same settings as Starlette's JSONResponse, so
+    responses are byte-for-byte what FastAPI produced before.
+
+    Args:
+        obj (Any): JSON-compatible object
+
+    Returns:
+        bytes: Encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        allow_nan=False,
+        indent=None,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def loads(data: bytes) -> Any:
+    """
+    Deserialize JSON from bytes or str
+
+    Args:
+        data (bytes): Encoded JSON
+
+    Returns:
+        Any: Decoded object
+
+    Raises:
+        ValueError: If the input is not valid JSON
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
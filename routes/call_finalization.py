@@ -1,10 +1,9 @@
-from fastapi import APIRouter, HTTPException, Depends, Request
+from fastapi import APIRouter, HTTPException, Depends, Request, Header
 from pydantic import BaseModel, model_validator
 from typing import Optional
 from functions.call_service import CallService
+from functions.response_cache import response_cache, cached_json_response, encode_json, FastJSONResponse
 from auth import verify_api_key_header
-import os
-import json
 
 router = APIRouter()
 
@@ -40,7 +39,7 @@ async def create_deal(
     try:
         call_service = CallService()
         result = await call_service.process_call_finalization(request_body)
-        return result
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating deal: {str(e)}")
 
@@ -53,67 +52,25 @@ async def create_call(
     try:
         call_service = CallService()
         result = await call_service.process_call_no_deal(request_body)
-        return result
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating call: {str(e)}")
 
 @router.get("/calls")
-async def get_calls(user_info: dict = Depends(verify_api_key_header)):
-    temp_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "temp")
-    calls = []
-    stats = {
-        "total_calls": 0,
-        "total_deals": 0,
-        "total_no_deals": 0,
-        "reasons": {},
-        "avg_final_price": None,
-        "avg_negotiation_rounds": None
-    }
-    final_prices = []
-    negotiation_rounds = []
-    
-    try:
-        for filename in os.listdir(temp_dir):
-            if filename.endswith(".json"):
-                filepath = os.path.join(temp_dir, filename)
-                try:
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        calls.append(data)
-                        
-                        # Check if this is a deal (has final_price) or no-deal (has reason)
-                        if "reason" in data:
-                            # This is a no-deal call
-                            stats["total_no_deals"] += 1
-                            reason = data.get("reason")
-                            if reason:
-                                stats["reasons"].setdefault(reason, 0)
-                                stats["reasons"][reason] += 1
-                        elif "final_price" in data:
-                            # This is a successful deal
-                            stats["total_deals"] += 1
-                            price = data.get("final_price")
-                            rounds = data.get("negotiation_rounds")
-                            try:
-                                if price is not None:
-                                    final_prices.append(float(price))
-                            except Exception:
-                                pass
-                            try:
-                                if rounds is not None:
-                                    negotiation_rounds.append(int(rounds))
-                            except Exception:
-                                pass
-                        
-                except Exception as e:
-                    print(f"[WARN] Could not read {filename}: {e}")
-    except FileNotFoundError:
-        print(f"[WARN] Temp directory not found: {temp_dir}")
-    
-    stats["total_calls"] = stats["total_deals"] + stats["total_no_deals"]
-    if final_prices:
-        stats["avg_final_price"] = round(sum(final_prices) / len(final_prices), 2)
-    if negotiation_rounds:
-        stats["avg_negotiation_rounds"] = round(sum(negotiation_rounds) / len(negotiation_rounds), 2)
+async def get_calls(
+    user_info: dict = Depends(verify_api_key_header),
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Devuelve todas las llamadas guardadas y sus estadísticas.
     
-    return {"calls": calls, "stats": stats} 
\ No newline at end of file
+    La respuesta serializada se cachea por versión del almacén de llamadas; con
+    `If-None-Match` vigente se responde 304 sin leer disco.
+    """
+    call_service = CallService()
+    version = call_service.store_version
+    cached = response_cache.get("calls", "", version)
+    if cached is None:
+        result = call_service.get_calls_with_stats()
+        cached = response_cache.put("calls", "", version, encode_json(result))
+    return cached_json_response(cached, if_none_match)
\ No newline at end of file
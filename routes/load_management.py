@@ -1,6 +1,7 @@
-from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi import APIRouter, HTTPException, Query, Depends, Header
 from typing import Optional
 from functions.load_service import LoadService
+from functions.response_cache import response_cache, cached_json_response, encode_json, FastJSONResponse
 from auth import verify_api_key_header
 
 router = APIRouter()
@@ -8,11 +9,15 @@ router = APIRouter()
 @router.get("/loads/best")
 async def get_best_load(
     equipment_type: Optional[str] = Query(None, description="Tipo de camión"),
-    user_info: dict = Depends(verify_api_key_header)
+    user_info: dict = Depends(verify_api_key_header),
+    if_none_match: Optional[str] = Header(None)
 ):
     """
     Devuelve una carga disponible adecuada según el tipo de camión o de forma aleatoria si no se especifica.
     
+    Las respuestas deterministas (tipo de camión con cargas disponibles) llevan ETag y
+    responden 304 a `If-None-Match` mientras el inventario no cambie.
+    
     Args:
         equipment_type (Optional[str]): Tipo de camión
     
@@ -21,7 +26,20 @@ async def get_best_load(
     """
     try:
         load_service = LoadService()
+        if not equipment_type:
+            return FastJSONResponse(await load_service.get_best_available_load(equipment_type))
+
+        cache_key = equipment_type.lower()
+        version = load_service.inventory_version
+        cached = response_cache.get("loads_best", cache_key, version)
+        if cached is not None:
+            return cached_json_response(cached, if_none_match)
+
         result = await load_service.get_best_available_load(equipment_type)
-        return result
+        # Only the best-match selection is deterministic; random fallbacks are never cached
+        if result == load_service.find_best_load(equipment_type):
+            entry = response_cache.put("loads_best", cache_key, version, encode_json(result))
+            return cached_json_response(entry)
+        return FastJSONResponse(result)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting best load: {str(e)}") 
\ No newline at end of file